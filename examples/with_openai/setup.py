@@ -3,6 +3,14 @@
 setup(
     name="with_openai",
     packages=find_packages(exclude=["with_openai_tests"]),
-    install_requires=["dagster", "dagster-openai", "langchain==0.1.11"],
+    install_requires=[
+        "dagster",
+        "dagster-openai",
+        "faiss-cpu",
+        "langchain==0.1.11",
+        "orjson",
+        "tenacity",
+        "tiktoken",
+    ],
     extras_require={"dev": ["dagster-webserver", "pytest"]},
 )
@@ -1,6 +1,10 @@
 import os
-import pickle
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+import faiss
 from dagster import (
     AssetExecutionContext,
     Config,
@@ -12,14 +16,29 @@
 from filelock import FileLock
 from langchain.chains.qa_with_sources import stuff_prompt
 from langchain.chat_models.openai import ChatOpenAI
-from langchain.docstore.document import Document
 from langchain.embeddings.openai import OpenAIEmbeddings
 from langchain.schema.output_parser import StrOutputParser
-from langchain.text_splitter import CharacterTextSplitter
-from langchain.vectorstores.faiss import FAISS
-
-from .constants import SEARCH_INDEX_FILE, SUMMARY_TEMPLATE
-from .utils import get_github_docs
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from openai import RateLimitError
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+
+from .constants import (
+    CHUNK_OVERLAP_TOKENS,
+    CHUNK_SIZE_TOKENS,
+    EMBEDDING_BATCH_SIZE,
+    EMBEDDING_MAX_CONCURRENCY,
+    EMBEDDING_MODEL,
+    IVF_NPROBE,
+    SEARCH_INDEX_FILE,
+    SUMMARY_TEMPLATE,
+)
+from .utils import (
+    add_to_search_index,
+    build_search_index,
+    get_github_docs,
+    load_search_index,
+    save_search_index,
+)
 
 docs_partitions_def = StaticPartitionsDefinition(
     ["concepts", "dagster-cloud", "deployment", "guides", "integrations"]
@@ -33,29 +52,53 @@ def source_docs(context: AssetExecutionContext):
 
 @asset(compute_kind="OpenAI", partitions_def=docs_partitions_def)
 def search_index(context: AssetExecutionContext, openai: OpenAIResource, source_docs):
-    source_chunks = []
-    splitter = CharacterTextSplitter(separator=" ", chunk_size=1024, chunk_overlap=0)
-    for source in source_docs:
-        context.log.info(source)
-        for chunk in splitter.split_text(source.page_content):
-            source_chunks.append(Document(page_content=chunk, metadata=source.metadata))
+    splitter = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+        model_name=EMBEDDING_MODEL,
+        chunk_size=CHUNK_SIZE_TOKENS,
+        chunk_overlap=CHUNK_OVERLAP_TOKENS,
+    )
+    source_chunks = splitter.create_documents(
+        texts=[source.page_content for source in source_docs],
+        metadatas=[source.metadata for source in source_docs],
+    )
+    context.log.info(f"Split {len(source_docs)} docs into {len(source_chunks)} chunks")
+
+    texts = [chunk.page_content for chunk in source_chunks]
+    metadatas = [chunk.metadata for chunk in source_chunks]
 
     with openai.get_client(context) as client:
-        search_index = FAISS.from_documents(
-            source_chunks, OpenAIEmbeddings(client=client.embeddings)
+
+        @retry(
+            retry=retry_if_exception_type(RateLimitError),
+            wait=wait_exponential_jitter(),
+            stop=stop_after_attempt(6),
         )
+        def embed_batch(batch):
+            time.sleep(random.uniform(0, 0.05))
+            return client.embeddings.create(model=EMBEDDING_MODEL, input=batch).data
 
-    with FileLock(SEARCH_INDEX_FILE):
-        if os.path.getsize(SEARCH_INDEX_FILE) > 0:
-            with open(SEARCH_INDEX_FILE, "rb") as f:
-                serialized_search_index = pickle.load(f)
-            cached_search_index = FAISS.deserialize_from_bytes(
-                serialized_search_index, OpenAIEmbeddings()
+        batches = [
+            texts[i : i + EMBEDDING_BATCH_SIZE] for i in range(0, len(texts), EMBEDDING_BATCH_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=EMBEDDING_MAX_CONCURRENCY) as executor:
+            results = list(executor.map(embed_batch, batches))
+        embeddings = [data.embedding for batch in results for data in batch]
+
+    # The lock only serializes writers, so that concurrent partitions don't drop each other's
+    # chunks; readers rely on save_search_index committing a new index with a single atomic
+    # rename.
+    with FileLock(f"{SEARCH_INDEX_FILE}.lock"):
+        if os.path.exists(SEARCH_INDEX_FILE):
+            search_index = add_to_search_index(
+                load_search_index(SEARCH_INDEX_FILE, OpenAIEmbeddings()),
+                texts,
+                embeddings,
+                metadatas,
             )
-            search_index.merge_from(cached_search_index)
+        else:
+            search_index = build_search_index(texts, embeddings, metadatas, OpenAIEmbeddings())
 
-        with open(SEARCH_INDEX_FILE, "wb") as f:
-            pickle.dump(search_index.serialize_to_bytes(), f)
+        save_search_index(search_index, SEARCH_INDEX_FILE)
 
 
 class OpenAIConfig(Config):
@@ -63,11 +106,18 @@ class OpenAIConfig(Config):
     question: str
 
 
+# Keyed on the modification time of the file that commits each new index, so a rebuilt index is
+# picked up automatically.
+@lru_cache(maxsize=1)
+def _load_cached_search_index(path, modified_time):
+    return load_search_index(path, OpenAIEmbeddings())
+
+
 @asset(compute_kind="OpenAI")
 def completion(context: AssetExecutionContext, openai: OpenAIResource, config: OpenAIConfig):
-    with open(SEARCH_INDEX_FILE, "rb") as f:
-        serialized_search_index = pickle.load(f)
-    search_index = FAISS.deserialize_from_bytes(serialized_search_index, OpenAIEmbeddings())
+    search_index = _load_cached_search_index(SEARCH_INDEX_FILE, os.path.getmtime(SEARCH_INDEX_FILE))
+    if isinstance(search_index.index, faiss.IndexIVF):
+        search_index.index.nprobe = IVF_NPROBE
     with openai.get_client(context) as client:
         prompt = stuff_prompt.PROMPT
         model = ChatOpenAI(client=client.chat.completions, model=config.model, temperature=0)
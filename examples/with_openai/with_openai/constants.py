@@ -1,4 +1,20 @@
-SEARCH_INDEX_FILE = "search_index.pickle"
+# Docstore pickle that also names the FAISS index file it belongs to. Earlier versions of this
+# example wrote a different format to "search_index.pickle", so that name is not reused.
+SEARCH_INDEX_FILE = "faiss_search_index.pickle"
+
+MARKDOWN_READ_MAX_WORKERS = 16
+
+EMBEDDING_MODEL = "text-embedding-ada-002"
+CHUNK_SIZE_TOKENS = 512
+CHUNK_OVERLAP_TOKENS = 32
+# Chunks are at most CHUNK_SIZE_TOKENS long, so a batch holds at most ~131k tokens, within the
+# embeddings endpoint's per-request input limits (2048 inputs, 300k tokens).
+EMBEDDING_BATCH_SIZE = 256
+EMBEDDING_MAX_CONCURRENCY = 5
+
+# Below this many chunks an exhaustive flat index is fast enough and exact.
+IVF_INDEX_MIN_CHUNKS = 4096
+IVF_NPROBE = 8
 
 SUMMARY_TEMPLATE = """
 Content: {content}
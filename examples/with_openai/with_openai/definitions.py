@@ -1,6 +1,7 @@
 import json
 import os
 
+import orjson
 from dagster import (
     Definitions,
     EnvVar,
@@ -14,24 +15,27 @@
 from . import assets
 from .assets import question_job, search_index_job
 
+PATH_TO_QUESTIONS = os.path.join(os.path.dirname(__file__), "../../", "data/questions")
+
 
 @sensor(job=question_job)
 def question_sensor(context):
-    PATH_TO_QUESTIONS = os.path.join(os.path.dirname(__file__), "../../", "data/questions")
-
-    previous_state = json.loads(context.cursor) if context.cursor else {}
+    previous_state = orjson.loads(context.cursor) if context.cursor else {}
     current_state = {}
     runs_to_request = []
 
-    for filename in os.listdir(PATH_TO_QUESTIONS):
-        file_path = os.path.join(PATH_TO_QUESTIONS, filename)
-        if filename.endswith(".json") and os.path.isfile(file_path):
-            last_modified = os.path.getmtime(file_path)
+    with os.scandir(PATH_TO_QUESTIONS) as entries:
+        for entry in entries:
+            if not (entry.name.endswith(".json") and entry.is_file()):
+                continue
+
+            filename = entry.name
+            last_modified = entry.stat().st_mtime
 
             current_state[filename] = last_modified
 
             if filename not in previous_state or previous_state[filename] != last_modified:
-                with open(file_path, "r") as f:
+                with open(entry.path, "r") as f:
                     request_config = json.load(f)
 
                     runs_to_request.append(
@@ -41,7 +45,7 @@ def question_sensor(context):
                         )
                     )
 
-    return SensorResult(run_requests=runs_to_request, cursor=json.dumps(current_state))
+    return SensorResult(run_requests=runs_to_request, cursor=orjson.dumps(current_state).decode())
 
 
 all_assets = load_assets_from_modules([assets])
@@ -1,17 +1,36 @@
+import contextlib
+import glob
+import mmap
 import os
 import pathlib
+import pickle
 import subprocess
 import tempfile
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 
+import faiss
+import numpy as np
 import requests
 from langchain.docstore.document import Document
+from langchain.docstore.in_memory import InMemoryDocstore
+from langchain.schema.embeddings import Embeddings
+from langchain.vectorstores.faiss import FAISS
+from langchain.vectorstores.utils import DistanceStrategy
+from requests.adapters import HTTPAdapter
+
+from .constants import IVF_INDEX_MIN_CHUNKS, MARKDOWN_READ_MAX_WORKERS
+
+# Shared so that repeated calls reuse pooled connections instead of a new TLS handshake each time
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=3))
 
 
 def get_wiki_data(title, first_paragraph_only):
     url = f"https://en.wikipedia.org/w/api.php?format=json&action=query&prop=extracts&explaintext=1&titles={title}"
     if first_paragraph_only:
         url += "&exintro=1"
-    data = requests.get(url).json()
+    data = _session.get(url, timeout=10).json()
     return Document(
         page_content=next(iter(data["query"]["pages"].values()))["extract"],
         metadata={"source": f"https://en.wikipedia.org/wiki/{title}"},
@@ -21,7 +40,13 @@ def get_wiki_data(title, first_paragraph_only):
 def get_github_docs(repo_owner, repo_name, category):
     with tempfile.TemporaryDirectory() as d:
         subprocess.check_call(
-            f"git clone --depth 1 https://github.com/{repo_owner}/{repo_name}.git .",
+            "git clone --depth 1 --filter=blob:none --sparse"
+            f" https://github.com/{repo_owner}/{repo_name}.git .",
+            cwd=d,
+            shell=True,
+        )
+        subprocess.check_call(
+            f"git sparse-checkout set docs/content/{category}",
             cwd=d,
             shell=True,
         )
@@ -30,10 +55,161 @@ def get_github_docs(repo_owner, repo_name, category):
         )
         docs_path = pathlib.Path(os.path.join(d, "docs/content", category))
         markdown_files = list(docs_path.glob("*/*.md")) + list(docs_path.glob("*/*.mdx"))
-        for index, markdown_file in enumerate(markdown_files):
-            with open(markdown_file, "r") as f:
-                relative_path = markdown_file.relative_to(docs_path)
-                github_url = (
-                    f"https://github.com/{repo_owner}/{repo_name}/blob/{git_sha}/{relative_path}"
-                )
-                yield Document(page_content=f.read(), metadata={"source": github_url})
+        github_urls = [
+            f"https://github.com/{repo_owner}/{repo_name}/blob/{git_sha}/{markdown_file.relative_to(docs_path)}"
+            for markdown_file in markdown_files
+        ]
+        with ThreadPoolExecutor(max_workers=MARKDOWN_READ_MAX_WORKERS) as executor:
+            yield from executor.map(_read_markdown_file, markdown_files, github_urls)
+
+
+def _read_markdown_file(markdown_file, github_url):
+    with open(markdown_file, "r") as f:
+        return Document(page_content=f.read(), metadata={"source": github_url})
+
+
+def build_faiss_index(embeddings):
+    vectors = _normalize_vectors(embeddings)
+    num_vectors, dimension = vectors.shape
+    # Vectors are stored as fp16, halving memory bandwidth at search time. fp16 decodes back to
+    # (nearly) the original vectors, which add_to_search_index relies on when it rebuilds a flat
+    # index as an IVF index.
+    if num_vectors < IVF_INDEX_MIN_CHUNKS:
+        index = faiss.IndexScalarQuantizer(
+            dimension, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_INNER_PRODUCT
+        )
+        index.train(vectors)
+    else:
+        num_cells = int(np.sqrt(num_vectors))
+        quantizer = faiss.IndexFlatIP(dimension)
+        index = faiss.IndexIVFScalarQuantizer(
+            quantizer,
+            dimension,
+            num_cells,
+            faiss.ScalarQuantizer.QT_fp16,
+            faiss.METRIC_INNER_PRODUCT,
+        )
+        # Train on a sample, keeping enough points per cell for k-means to be stable
+        num_training_vectors = min(num_vectors, max(num_vectors // 10, 39 * num_cells))
+        training_sample = np.random.default_rng().choice(
+            num_vectors, size=num_training_vectors, replace=False
+        )
+        index.train(vectors[training_sample])
+    index.add(vectors)
+    return index
+
+
+def _normalize_vectors(embeddings):
+    vectors = np.array(embeddings, dtype=np.float32)
+    faiss.normalize_L2(vectors)
+    return vectors
+
+
+def build_search_index(texts, embeddings, metadatas, embedding_function):
+    ids = [str(uuid.uuid4()) for _ in texts]
+    docstore = InMemoryDocstore(
+        {
+            _id: Document(page_content=text, metadata=metadata)
+            for _id, text, metadata in zip(ids, texts, metadatas)
+        }
+    )
+    return _wrap_faiss_index(
+        build_faiss_index(embeddings), docstore, dict(enumerate(ids)), embedding_function
+    )
+
+
+def add_to_search_index(search_index, texts, embeddings, metadatas):
+    vectors = _normalize_vectors(embeddings)
+    num_existing_vectors = search_index.index.ntotal
+    if (
+        not isinstance(search_index.index, faiss.IndexIVF)
+        and num_existing_vectors + len(vectors) >= IVF_INDEX_MIN_CHUNKS
+    ):
+        # The corpus has just outgrown the flat index, so train an IVF index over all of it once.
+        # Later additions reuse its trained quantizer and only append.
+        existing_vectors = search_index.index.reconstruct_n(0, num_existing_vectors)
+        search_index.index = build_faiss_index(np.vstack([existing_vectors, vectors]))
+    else:
+        search_index.index.add(vectors)
+
+    ids = [str(uuid.uuid4()) for _ in texts]
+    search_index.docstore.add(
+        {
+            _id: Document(page_content=text, metadata=metadata)
+            for _id, text, metadata in zip(ids, texts, metadatas)
+        }
+    )
+    search_index.index_to_docstore_id.update(
+        {num_existing_vectors + i: _id for i, _id in enumerate(ids)}
+    )
+    return search_index
+
+
+class _NormalizedEmbeddings(Embeddings):
+    """Wraps an embedding model so that the vectors it returns are L2-normalized, like the ones
+    stored in the index, making inner-product search equivalent to cosine similarity.
+    """
+
+    def __init__(self, embeddings):
+        self.embeddings = embeddings
+
+    def embed_documents(self, texts):
+        return _normalize_vectors(self.embeddings.embed_documents(texts)).tolist()
+
+    def embed_query(self, text):
+        return _normalize_vectors([self.embeddings.embed_query(text)])[0].tolist()
+
+
+def _wrap_faiss_index(index, docstore, index_to_docstore_id, embedding_function):
+    return FAISS(
+        embedding_function=_NormalizedEmbeddings(embedding_function),
+        index=index,
+        docstore=docstore,
+        index_to_docstore_id=index_to_docstore_id,
+        distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT,
+    )
+
+
+def save_search_index(search_index, path):
+    # The FAISS index is written to a uniquely named file which the docstore pickle refers to.
+    # Atomically replacing the pickle is the single commit point, so readers see either the old
+    # index or the new one, never a mix of the two.
+    index_path = f"{path}.{uuid.uuid4()}.faiss"
+    faiss.write_index(search_index.index, index_path)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(
+            (
+                os.path.basename(index_path),
+                search_index.docstore,
+                search_index.index_to_docstore_id,
+            ),
+            f,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    os.replace(tmp_path, path)
+
+    # Clean up index files from earlier commits, and from writers that died before committing.
+    # A file that can't be removed yet (e.g. open by a reader on Windows) is retried next time.
+    for stale_index_path in glob.glob(f"{glob.escape(path)}.*.faiss"):
+        if stale_index_path != index_path:
+            with contextlib.suppress(OSError):
+                os.remove(stale_index_path)
+
+
+def load_search_index(path, embeddings):
+    stale_index_filename = None
+    while True:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            index_filename, docstore, index_to_docstore_id = pickle.loads(m)
+        index_path = os.path.join(os.path.dirname(path), index_filename)
+        try:
+            index = faiss.read_index(index_path)
+        except RuntimeError:
+            # Index files are removed once a newer index is committed. If that happened after the
+            # docstore above was read, re-reading it picks up the new index file.
+            if index_filename == stale_index_filename or os.path.exists(index_path):
+                raise
+            stale_index_filename = index_filename
+            continue
+        return _wrap_faiss_index(index, docstore, index_to_docstore_id, embeddings)
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from operator import attrgetter
 from typing import TYPE_CHECKING, Optional, Sequence, Union
 
 import dagster._check as check
@@ -53,6 +54,7 @@ def get_partition_sets_or_error(
         for partition_set in repository.get_external_partition_sets()
         if partition_set.job_name == pipeline_name
     ]
+    partition_sets.sort(key=attrgetter("job_name", "mode", "name"))
 
     return GraphenePartitionSets(
         results=[
@@ -60,14 +62,7 @@ def get_partition_sets_or_error(
                 external_repository_handle=repository.handle,
                 external_partition_set=partition_set,
             )
-            for partition_set in sorted(
-                partition_sets,
-                key=lambda partition_set: (
-                    partition_set.job_name,
-                    partition_set.mode,
-                    partition_set.name,
-                ),
-            )
+            for partition_set in partition_sets
         ]
     )
 
@@ -81,15 +76,13 @@ def get_partition_set(
     check.str_param(partition_set_name, "partition_set_name")
     location = graphene_info.context.get_code_location(repository_selector.location_name)
     repository = location.get_repository(repository_selector.repository_name)
-    partition_sets = repository.get_external_partition_sets()
-    for partition_set in partition_sets:
-        if partition_set.name == partition_set_name:
-            return GraphenePartitionSet(
-                external_repository_handle=repository.handle,
-                external_partition_set=partition_set,
-            )
+    if not repository.has_external_partition_set(partition_set_name):
+        return GraphenePartitionSetNotFoundError(partition_set_name)
 
-    return GraphenePartitionSetNotFoundError(partition_set_name)
+    return GraphenePartitionSet(
+        external_repository_handle=repository.handle,
+        external_partition_set=repository.get_external_partition_set(partition_set_name),
+    )
 
 
 def get_partition_by_name(
@@ -2,11 +2,14 @@
 from enum import Enum
 from typing import (
     Any,
+    ClassVar,
     Dict,
+    FrozenSet,
     List,
     Mapping,
     Optional,
     Set,
+    Tuple,
     Type,
     cast,
 )
@@ -46,7 +49,7 @@
     model_config,
     model_fields,
 )
-from .type_check_utils import is_literal
+from .type_check_utils import is_literal, safe_is_config_subclass
 from .typing_utils import BaseConfigMeta
 
 try:
@@ -208,6 +211,20 @@ def asset_with_config(config: MyAssetConfig):
 
     """
 
+    # Marker checked by safe_is_config_subclass in place of issubclass(cls, Config)
+    _is_dagster_config: ClassVar[bool] = True
+
+    # Schemas inferred by infer_schema_from_config_class, keyed on (description, fields_to_omit).
+    # Stored on the class so that cached schemas are freed along with the class.
+    __dagster_schema_cache__: ClassVar[
+        Dict[Tuple[Optional[str], FrozenSet[str]], DagsterField]
+    ] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Reset on every subclass so that a subclass never picks up the schemas of its parent
+        cls.__dagster_schema_cache__ = {}
+
     def __init__(self, **config_dict) -> None:
         """This constructor is overridden to handle any remapping of raw config dicts to
         the appropriate config classes. For example, discriminated unions are represented
@@ -247,7 +264,7 @@ def __init__(self, **config_dict) -> None:
                 and value not in [member.value for member in field.annotation]
             ):
                 modified_data[key] = field.annotation.__members__[value].value
-            elif field and safe_is_subclass(field.annotation, Config) and isinstance(value, dict):
+            elif field and safe_is_config_subclass(field.annotation) and isinstance(value, dict):
                 modified_data[key] = field.annotation._get_non_default_public_field_values_cls(  # noqa: SLF001
                     value
                 )
@@ -409,17 +426,30 @@ def infer_schema_from_config_class(
     description: Optional[str] = None,
     fields_to_omit: Optional[Set[str]] = None,
 ) -> DagsterField:
-    from .config import Config
-    from .resource import ConfigurableResourceFactory, _is_annotated_as_resource_type
-
     """Parses a structured config class and returns a corresponding Dagster config Field."""
-    fields_to_omit = fields_to_omit or set()
-
     check.param_invariant(
-        safe_is_subclass(model_cls, Config),
+        safe_is_config_subclass(model_cls),
         "Config type annotation must inherit from dagster.Config",
     )
 
+    # The inferred schema depends only on the class definition, so it is cached on the class to
+    # avoid re-walking the same pydantic fields every time a resource or config object of that
+    # class is constructed.
+    cache_key = (description, frozenset(fields_to_omit) if fields_to_omit else frozenset())
+    field = model_cls.__dagster_schema_cache__.get(cache_key)
+    if field is None:
+        field = _infer_schema_from_config_class(model_cls, *cache_key)
+        model_cls.__dagster_schema_cache__[cache_key] = field
+    return field
+
+
+def _infer_schema_from_config_class(
+    model_cls: Type["Config"],
+    description: Optional[str],
+    fields_to_omit: FrozenSet[str],
+) -> DagsterField:
+    from .resource import ConfigurableResourceFactory, _is_annotated_as_resource_type
+
     fields: Dict[str, DagsterField] = {}
     for key, pydantic_field_info in model_fields(model_cls).items():
         if _is_annotated_as_resource_type(
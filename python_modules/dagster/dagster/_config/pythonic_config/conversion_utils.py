@@ -55,7 +55,7 @@ class cached_property:
 )
 
 from .pydantic_compat_layer import ModelFieldCompat, PydanticUndefined, model_fields
-from .type_check_utils import is_optional, safe_is_subclass
+from .type_check_utils import is_optional, safe_is_config_subclass, safe_is_subclass
 
 
 # This is from https://github.com/dagster-io/dagster/pull/11470
@@ -120,13 +120,13 @@ def _convert_pydantic_field(
         model_cls (Optional[Type]): The Pydantic model class that the field belongs to. This is
             used for error messages.
     """
-    from .config import Config, infer_schema_from_config_class
+    from .config import infer_schema_from_config_class
 
     if pydantic_field.discriminator:
         return _convert_pydantic_discriminated_union_field(pydantic_field)
 
     field_type = pydantic_field.annotation
-    if safe_is_subclass(field_type, Config):
+    if safe_is_config_subclass(field_type):
         inferred_field = infer_schema_from_config_class(
             field_type,
             description=pydantic_field.description,
@@ -208,9 +208,9 @@ def _config_type_for_type_on_pydantic_field(
             _config_type_for_type_on_pydantic_field(value_type),
         )
 
-    from .config import Config, infer_schema_from_config_class
+    from .config import infer_schema_from_config_class
 
-    if safe_is_subclass(potential_dagster_type, Config):
+    if safe_is_config_subclass(potential_dagster_type):
         inferred_field = infer_schema_from_config_class(
             potential_dagster_type,
         )
@@ -294,9 +294,9 @@ class OpConfigWithUnion(Config):
 
 def infer_schema_from_config_annotation(model_cls: Any, config_arg_default: Any) -> Field:
     """Parses a structured config class or primitive type and returns a corresponding Dagster config Field."""
-    from .config import Config, infer_schema_from_config_class
+    from .config import infer_schema_from_config_class
 
-    if safe_is_subclass(model_cls, Config):
+    if safe_is_config_subclass(model_cls):
         check.invariant(
             config_arg_default is inspect.Parameter.empty,
             "Cannot provide a default value when using a Config class",
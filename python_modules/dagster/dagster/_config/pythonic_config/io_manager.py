@@ -38,7 +38,7 @@
     ResourceWithKeyMapping,
     T_Self,
 )
-from .type_check_utils import safe_is_subclass
+from .type_check_utils import safe_is_config_subclass, safe_is_subclass
 
 try:
     from functools import cached_property  # type: ignore  # (py37 compat)
@@ -66,12 +66,12 @@ def __init__(
     ):
         input_config_schema_resolved: CoercableToConfigSchema = (
             cast(Type[Config], input_config_schema).to_config_schema()
-            if safe_is_subclass(input_config_schema, Config)
+            if safe_is_config_subclass(input_config_schema)
             else cast(CoercableToConfigSchema, input_config_schema)
         )
         output_config_schema_resolved: CoercableToConfigSchema = (
             cast(Type[Config], output_config_schema).to_config_schema()
-            if safe_is_subclass(output_config_schema, Config)
+            if safe_is_config_subclass(output_config_schema)
             else cast(CoercableToConfigSchema, output_config_schema)
         )
         super().__init__(
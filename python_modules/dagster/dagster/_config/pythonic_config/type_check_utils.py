@@ -25,6 +25,14 @@ def safe_is_subclass(cls: Any, possible_parent_cls: Union[Type, Tuple[Type, ...]
         return False
 
 
+def safe_is_config_subclass(cls: Any) -> bool:
+    """Equivalent to safe_is_subclass(cls, Config), but checks the marker attribute defined on
+    dagster.Config instead of walking the MRO, since this is called for every field during schema
+    inference.
+    """
+    return isinstance(cls, type) and getattr(cls, "_is_dagster_config", False) is True
+
+
 def is_optional(annotation: Type) -> bool:
     """Returns true if the annotation signifies an Optional type.
 
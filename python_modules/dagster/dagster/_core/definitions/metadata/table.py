@@ -21,6 +21,8 @@ class TableRecord(
     strings, integers, floats, or bools.
     """
 
+    __slots__ = ()
+
     def __new__(cls, data: Mapping[str, Union[str, int, float, bool]]):
         check.dict_param(
             data,
@@ -102,6 +104,8 @@ class TableSchema(
         constraints (Optional[TableConstraints]): The constraints of the table.
     """
 
+    __slots__ = ()
+
     def __new__(
         cls,
         columns: Sequence["TableColumn"],
@@ -151,6 +155,8 @@ class TableConstraints(
         other (List[str]): Descriptions of arbitrary table-level constraints.
     """
 
+    __slots__ = ()
+
     def __new__(
         cls,
         other: Sequence[str],
@@ -194,6 +200,8 @@ class TableColumn(
             If unspecified, column is nullable with no constraints.
     """
 
+    __slots__ = ()
+
     def __new__(
         cls,
         name: str,
@@ -201,20 +209,27 @@ def __new__(
         description: Optional[str] = None,
         constraints: Optional["TableColumnConstraints"] = None,
     ):
+        constraints = cast(
+            "TableColumnConstraints",
+            check.opt_inst_param(
+                constraints,
+                "constraints",
+                TableColumnConstraints,
+                default=_DEFAULT_TABLE_COLUMN_CONSTRAINTS,
+            ),
+        )
+        # Columns rebuilt from serialized data each carry their own copy of the default
+        # constraints; share the module-level instance instead, as large schemas can have
+        # thousands of columns.
+        if constraints == _DEFAULT_TABLE_COLUMN_CONSTRAINTS:
+            constraints = _DEFAULT_TABLE_COLUMN_CONSTRAINTS
+
         return super(TableColumn, cls).__new__(
             cls,
             name=check.str_param(name, "name"),
             type=check.str_param(type, "type"),
             description=check.opt_str_param(description, "description"),
-            constraints=cast(
-                "TableColumnConstraints",
-                check.opt_inst_param(
-                    constraints,
-                    "constraints",
-                    TableColumnConstraints,
-                    default=_DEFAULT_TABLE_COLUMN_CONSTRAINTS,
-                ),
-            ),
+            constraints=constraints,
         )
 
 
@@ -245,6 +260,8 @@ class TableColumnConstraints(
             not expressible by the predefined properties.
     """
 
+    __slots__ = ()
+
     def __new__(
         cls,
         nullable: bool = True,
@@ -66,6 +66,38 @@ class ConfigClassTest(Config):
     ) == type_string_from_config_schema(config_class_config_field)
 
 
+def test_infer_config_schema_cached():
+    class CachedConfigClassTest(Config):
+        a_string: str
+        an_int: int
+
+    assert CachedConfigClassTest.__dagster_schema_cache__ == {}
+    field = infer_schema_from_config_class(CachedConfigClassTest)
+    assert infer_schema_from_config_class(CachedConfigClassTest) is field
+    assert infer_schema_from_config_class(CachedConfigClassTest, fields_to_omit=set()) is field
+
+    omitted_field = infer_schema_from_config_class(CachedConfigClassTest, fields_to_omit={"an_int"})
+    assert omitted_field is not field
+    assert infer_schema_from_config_class(CachedConfigClassTest, fields_to_omit={"an_int"}) is (
+        omitted_field
+    )
+    assert set(omitted_field.config_type.fields.keys()) == {"a_string"}
+
+    described_field = infer_schema_from_config_class(CachedConfigClassTest, description="foo")
+    assert described_field is not field
+    assert described_field.description == "foo"
+
+    assert len(CachedConfigClassTest.__dagster_schema_cache__) == 3
+
+    class CachedConfigSubclassTest(CachedConfigClassTest):
+        a_float: float
+
+    assert CachedConfigSubclassTest.__dagster_schema_cache__ == {}
+    assert set(
+        infer_schema_from_config_class(CachedConfigSubclassTest).config_type.fields.keys()
+    ) == {"a_string", "an_int", "a_float"}
+
+
 def type_string_from_config_schema(config_schema):
     return print_config_type_to_string(convert_potential_field(config_schema).config_type)
 
@@ -1,7 +1,9 @@
 import sys
+from typing import List
 
 import pytest
-from dagster._config.pythonic_config.type_check_utils import is_optional
+from dagster import Config, ConfigurableResource
+from dagster._config.pythonic_config.type_check_utils import is_optional, safe_is_config_subclass
 
 
 def test_is_optional() -> None:
@@ -33,3 +35,20 @@ def test_is_optional_310_types() -> None:
 
     assert not is_optional(str | int)  # type: ignore
     assert not is_optional(str | int | None)  # type: ignore
+
+
+def test_safe_is_config_subclass() -> None:
+    class MyConfig(Config):
+        a_str: str
+
+    class MyResource(ConfigurableResource):
+        a_str: str
+
+    assert safe_is_config_subclass(Config)
+    assert safe_is_config_subclass(MyConfig)
+    assert safe_is_config_subclass(MyResource)
+
+    assert not safe_is_config_subclass(MyConfig(a_str="foo"))
+    assert not safe_is_config_subclass(str)
+    assert not safe_is_config_subclass(List[str])
+    assert not safe_is_config_subclass(None)
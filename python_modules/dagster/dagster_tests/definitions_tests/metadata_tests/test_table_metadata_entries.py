@@ -5,9 +5,11 @@
     TableMetadataEntries,
 )
 from dagster._core.definitions.metadata.table import (
+    TableColumnConstraints,
     TableColumnDep,
     TableColumnLineage,
 )
+from dagster._serdes import deserialize_value, serialize_value
 
 
 def test_table_metadata_entries():
@@ -28,6 +30,18 @@ def test_table_metadata_entries():
     assert TableMetadataEntries.extract(dict(TableMetadataEntries())) == TableMetadataEntries()
 
 
+def test_table_column_default_constraints_shared() -> None:
+    columns = [TableColumn("foo"), TableColumn("bar", constraints=TableColumnConstraints())]
+    assert columns[0].constraints is columns[1].constraints
+
+    deserialized = deserialize_value(serialize_value(TableSchema(columns=columns)), TableSchema)
+    assert deserialized.columns[0].constraints is columns[0].constraints
+    assert deserialized.columns[1].constraints is columns[0].constraints
+
+    unique_column = TableColumn("baz", constraints=TableColumnConstraints(unique=True))
+    assert unique_column.constraints.unique
+
+
 def test_invalid_column_lineage() -> None:
     with pytest.raises(CheckError):
         TableColumnLineage(